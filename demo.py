@@ -25,21 +25,32 @@ arguments to simply print basic information about the logged-in account.
 from __future__ import annotations
 
 import argparse
+import glob
+import os
 import signal
 import sys
 import textwrap
 import time
-from pathlib import Path
 from typing import Iterable, List, Optional
 
 from wxauto4 import Moment, WeChat, WxParam, WxResponse, wxlog
 
 
+_GLOB_CHARS = frozenset("*?[")
+
+
+def _has_glob_chars(path: str) -> bool:
+    """Return ``True`` when ``path`` contains glob wildcard characters."""
+
+    return not _GLOB_CHARS.isdisjoint(path)
+
+
 def _format_files(files: Iterable[str]) -> List[str]:
     """Expand and validate file paths.
 
     Args:
-        files: Iterable of file path strings provided by the user.
+        files: Iterable of file path strings provided by the user.  Glob
+            patterns such as ``*.png`` are expanded.
 
     Returns:
         A list of absolute paths that exist on disk.  Missing files trigger a
@@ -48,16 +59,38 @@ def _format_files(files: Iterable[str]) -> List[str]:
 
     resolved: List[str] = []
     for raw in files:
-        path = Path(raw).expanduser()
+        raw = os.path.expanduser(raw)
+        path = os.path.abspath(raw)
+        # Stat the literal path first so names like ``a[1].png`` still work.
         try:
-            path = path.resolve(strict=True)
+            os.stat(path)
         except FileNotFoundError:
-            print(f"[警告] 找不到文件: {path}")
+            pass
+        else:
+            resolved.append(path)
             continue
-        resolved.append(str(path))
+        if _has_glob_chars(raw):
+            # Sort so that glob matches are sent in a stable, predictable order.
+            matches = [os.path.abspath(candidate) for candidate in sorted(glob.glob(raw))]
+            if matches:
+                resolved.extend(matches)
+                continue
+        print(f"[警告] 找不到文件: {path}")
     return resolved
 
 
+def _fast_indent(text: str, prefix: str) -> str:
+    """Prefix every line of ``text`` with ``prefix``.
+
+    A lighter replacement for :func:`textwrap.indent` which avoids splitting
+    and re-joining the text line by line.  Only use it on already clean text
+    (no blank lines, no trailing newline) such as parsed moment content; for
+    arbitrary text use :func:`textwrap.indent`.
+    """
+
+    return prefix + text.replace("\n", "\n" + prefix)
+
+
 def _print_response(title: str, response: WxResponse) -> None:
     """Pretty-print :class:`WxResponse` objects with an action title."""
 
@@ -78,6 +111,7 @@ class WeChatDemo:
             WxParam.LANGUAGE = args.language
         listener = args.start_listener or bool(args.listen)
         self.wx = WeChat(start_listener=listener, debug=args.debug)
+        self._listening = bool(listener)
         wxlog.debug("WeChat demo initialized")
 
     # ------------------------------------------------------------------
@@ -118,23 +152,26 @@ class WeChatDemo:
         _print_response("发送消息", response)
 
     def send_files(self) -> None:
-        if not self.args.files:
+        args = self.args
+        if not args.files:
             return
-        files = _format_files(self.args.files)
+        files = _format_files(args.files)
         if not files:
             print("[提示] 没有可发送的文件")
             return
-        response = self.wx.SendFiles(files if len(files) > 1 else files[0], who=self.args.target, exact=self.args.exact)
+        response = self.wx.SendFiles(files if len(files) > 1 else files[0], who=args.target, exact=args.exact)
         _print_response("发送文件", response)
 
     def switch_chat(self) -> None:
-        if not self.args.target:
+        args = self.args
+        target = args.target
+        if not target:
             return
-        result = self.wx.ChatWith(self.args.target, exact=self.args.exact, force=self.args.force, force_wait=self.args.force_wait)
+        result = self.wx.ChatWith(target, exact=args.exact, force=args.force, force_wait=args.force_wait)
         if isinstance(result, WxResponse):
             _print_response("切换聊天窗口", result)
         else:
-            nickname = result or self.args.target
+            nickname = result or target
             print(f"[成功] 切换到聊天窗口: {nickname}")
 
     def list_sessions(self) -> None:
@@ -148,10 +185,12 @@ class WeChatDemo:
     def dump_messages(self) -> None:
         if not self.args.show_messages:
             return
-        messages = self.wx.GetAllMessage()
-        print(f"当前聊天窗口共 {len(messages)} 条消息")
-        for msg in messages:
-            print(f"[{msg.attr}] {msg.sender}: {msg.content}")
+        wx = self.wx
+        messages = wx.GetAllMessage()
+        lines = [f"当前聊天窗口共 {len(messages)} 条消息"]
+        lines.extend(f"[{msg.attr}] {msg.sender}: {msg.content}" for msg in messages)
+        sys.stdout.write("\n".join(lines))
+        sys.stdout.write("\n")
 
     # ------------------------------------------------------------------
     # Listener related features
@@ -166,11 +205,11 @@ class WeChatDemo:
     def setup_listener(self) -> None:
         if not self.args.listen:
             return
-        targets = self.args.listen
-        if isinstance(targets, str):
-            targets = [targets]
-        for target in targets:
+        for target in self.args.listen:
             response = self.wx.AddListenChat(target, self._listener_callback)
+            # AddListenChat starts the listener thread before validating the
+            # target, so it has to be stopped on shutdown either way.
+            self._listening = True
             if isinstance(response, WxResponse) and not response:
                 _print_response(f"监听 {target}", response)
             else:
@@ -207,67 +246,77 @@ class WeChatDemo:
     def navigate_tabs(self) -> None:
         if not self.args.navigate:
             return
+        wx = self.wx
         print("切换到聊天页...")
-        self.wx.SwitchToChat()
+        wx.SwitchToChat()
         time.sleep(0.5)
         print("切换到联系人页...")
-        self.wx.SwitchToContact()
+        wx.SwitchToContact()
         time.sleep(0.5)
         print("切换到收藏页...")
-        self.wx.SwitchToFavorites()
+        wx.SwitchToFavorites()
         time.sleep(0.5)
         print("切换到文件传输页...")
-        self.wx.SwitchToFiles()
+        wx.SwitchToFiles()
         time.sleep(0.5)
         print("切换到朋友圈...")
-        self.wx.SwitchToMoments()
+        wx.SwitchToMoments()
         time.sleep(0.5)
         print("切换到搜一搜...")
-        self.wx.SwitchToBrowser()
+        wx.SwitchToBrowser()
 
     # ------------------------------------------------------------------
     # Moments
     # ------------------------------------------------------------------
     def show_moments(self) -> None:
-        if not self.args.moments:
+        args = self.args
+        if not args.moments:
             return
         moment: Moment = self.wx.Moment
-        items = moment.GetMoments(refresh=self.args.refresh_moments)
+        items = moment.GetMoments(refresh=args.refresh_moments)
         if not items:
             print("未读取到朋友圈动态")
             return
-        print(f"读取到 {len(items)} 条朋友圈动态")
+        prefix = "        "
+        comment_fmt = "        {}{}: {}".format
+        lines = [f"读取到 {len(items)} 条朋友圈动态"]
+        append = lines.append
         for idx, item in enumerate(items, 1):
-            print("-" * 40)
-            print(f"[{idx}] 发布者: {item.publisher}")
-            print(f"    时间: {item.timestamp}")
+            append("-" * 40)
+            append(f"[{idx}] 发布者: {item.publisher}")
+            append(f"    时间: {item.timestamp}")
             if item.text:
-                print("    内容:")
-                print(textwrap.indent(item.text, prefix="        "))
+                append("    内容:")
+                append(_fast_indent(item.text, prefix))
             if likes := item.like_users:
-                print(f"    点赞: {', '.join(likes)}")
+                append(f"    点赞: {', '.join(likes)}")
             if comments := item.comment_list:
-                print("    评论:")
+                append("    评论:")
                 for comment in comments:
                     reply = f" 回复 {comment.reply_to}" if comment.reply_to else ""
-                    print(f"        {comment.author}{reply}: {comment.content}")
+                    append(comment_fmt(comment.author, reply, comment.content))
+        sys.stdout.write("\n".join(lines))
+        sys.stdout.write("\n")
 
-        if self.args.like:
-            item = moment.FindMomentByPublisher(self.args.like, refresh=False)
+        like_target = args.like
+        if like_target:
+            item = moment.FindMomentByPublisher(like_target, refresh=False)
             if not item:
-                print(f"[提示] 未找到 {self.args.like} 的朋友圈动态")
+                print(f"[提示] 未找到 {like_target} 的朋友圈动态")
             else:
-                response = moment.Like(item, cancel=self.args.cancel_like)
+                response = moment.Like(item, cancel=args.cancel_like)
                 _print_response("朋友圈点赞", response)
-        if self.args.comment:
-            if not self.args.comment_text:
+        comment_target = args.comment
+        if comment_target:
+            comment_text = args.comment_text
+            if not comment_text:
                 print("[提示] --comment 需要配合 --comment-text 使用")
             else:
-                item = moment.FindMomentByPublisher(self.args.comment, refresh=False)
+                item = moment.FindMomentByPublisher(comment_target, refresh=False)
                 if not item:
-                    print(f"[提示] 未找到 {self.args.comment} 的朋友圈动态")
+                    print(f"[提示] 未找到 {comment_target} 的朋友圈动态")
                 else:
-                    response = moment.Comment(item, self.args.comment_text, reply_to=self.args.reply_to)
+                    response = moment.Comment(item, comment_text, reply_to=args.reply_to)
                     _print_response("朋友圈评论", response)
 
     # ------------------------------------------------------------------
@@ -277,15 +326,15 @@ class WeChatDemo:
             return
         print(f"监听中，持续 {duration} 秒，按 Ctrl+C 可提前结束")
         try:
-            end_time = time.time() + duration
-            while time.time() < end_time:
-                time.sleep(1)
+            # A single sleep stays interruptible by Ctrl+C on Windows.
+            time.sleep(duration)
         except KeyboardInterrupt:
             print("捕获到 Ctrl+C, 准备退出...")
 
     def shutdown(self) -> None:
-        if getattr(self.wx, "_listener_is_listening", False):
+        if self._listening:
             self.wx.StopListening()
+            self._listening = False
         print("演示结束")
 
 
@@ -321,7 +370,17 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     parser.add_argument("--start-listener", action="store_true", help="启动时立即开启监听线程")
     parser.add_argument("--at", nargs="*", help="发送消息时 @ 的用户")
     parser.add_argument("--debug", action="store_true", help="启用调试日志")
-    return parser.parse_args(argv)
+    args = parser.parse_args(argv)
+
+    # Normalize list-like options once so callers can iterate them directly.
+    if isinstance(args.listen, str):
+        args.listen = [args.listen]
+    elif args.listen is None:
+        args.listen = []
+    if args.at is None:
+        args.at = ()
+    args.files = tuple(args.files or ())
+    return args
 
 
 def main(argv: Optional[List[str]] = None) -> int:
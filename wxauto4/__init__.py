@@ -1,18 +1,41 @@
-"""wxauto4 对外暴露的主要接口。"""
+"""wxauto4 对外暴露的主要接口。
+
+各接口在首次访问时才导入对应子模块（PEP 562），避免仅使用
+``WxResponse``、异常类型等轻量接口时加载 UIA / Win32 相关依赖。
+"""
 
 from __future__ import annotations
 
-from .wx import WeChat
-from .param import WxParam, WxResponse
-from .logger import wxlog
-from .moment import Moment
-from .exceptions import (
-    NetWorkError,
-    WxautoError,
-    WxautoNoteLoadTimeoutError,
-    WxautoUINotFoundError,
-)
-from .utils.lock import LockManager, uilock
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from .wx import WeChat
+    from .param import WxParam, WxResponse
+    from .logger import wxlog
+    from .moment import Moment
+    from .exceptions import (
+        NetWorkError,
+        WxautoError,
+        WxautoNoteLoadTimeoutError,
+        WxautoUINotFoundError,
+    )
+    from .utils.lock import LockManager, uilock
+
+
+_LAZY: Dict[str, str] = {
+    "WeChat": ".wx",
+    "WxParam": ".param",
+    "WxResponse": ".param",
+    "wxlog": ".logger",
+    "Moment": ".moment",
+    "LockManager": ".utils.lock",
+    "uilock": ".utils.lock",
+    "WxautoError": ".exceptions",
+    "NetWorkError": ".exceptions",
+    "WxautoUINotFoundError": ".exceptions",
+    "WxautoNoteLoadTimeoutError": ".exceptions",
+}
 
 
 __all__ = [
@@ -28,3 +51,17 @@ __all__ = [
     "WxautoUINotFoundError",
     "WxautoNoteLoadTimeoutError",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
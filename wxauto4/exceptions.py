@@ -2,11 +2,9 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
 class WxautoError(Exception):
     """基础异常类型。
 
@@ -16,13 +14,12 @@ class WxautoError(Exception):
     """
 
     default_message: str = ""
-    message: Optional[str] = None
-    detail: Optional[str] = None
 
-    def __post_init__(self) -> None:  # pragma: no cover - 简单数据绑定
-        msg = self.message or self.default_message or self.__class__.__name__
+    def __init__(self, message: Optional[str] = None, detail: Optional[str] = None) -> None:
+        msg = message or self.default_message or type(self).__name__
         super().__init__(msg)
         self.message = msg
+        self.detail = detail
 
     def __str__(self) -> str:
         return self.message or ""
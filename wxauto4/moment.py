@@ -8,8 +8,10 @@ UIA 控件解析为结构化数据对象。由于朋友圈界面为动态生成
 
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Optional
+from functools import cached_property, lru_cache
+from typing import AbstractSet, Dict, Iterable, List, Optional, Pattern, Tuple
 
 import re
 import time
@@ -20,6 +22,32 @@ from wxauto4.logger import wxlog
 from wxauto4.param import WxParam, WxResponse
 from wxauto4.ui.base import BaseUISubWnd
 from wxauto4.utils.tools import find_all_windows_from_root
+from wxauto4.utils.win32 import GetAllWindows
+
+
+# 以字面量开头的分支放在前面，便于正则引擎快速跳过不匹配的位置
+_TIME_RE = re.compile(
+    r"昨[天日]"
+    r"|星期[一二三四五六日天]"
+    r"|\d{1,2}:\d{2}"
+    r"|\d{2}-\d{2}"
+    r"|\d{4}年\d{1,2}月\d{1,2}日"
+)
+# 格式示例："张三 回复 李四：你好" 或 "张三: 哈喽"
+_COMMENT_RE = re.compile(r'^(?P<author>[^：:]+?)\s*(?:回复\s*(?P<reply>[^：:]+?)\s*)?[：:](?P<content>.*)$')
+_LIKE_SEPS = ('、', '，', ',', ':', '：')
+_ASCII_LIKE_SEPS = (',', ':')
+_LIKE_SPLIT_RE = re.compile(r'[、，,:：]')
+_DIGITS_RE = re.compile(r'\d+')
+# uiautomation.SendKeys 中具有特殊含义的字符需转义为 {x} 形式
+_SENDKEYS_ESCAPE = str.maketrans({'{': '{{}', '}': '{}}', '(': '{(}', ')': '{)}'})
+
+
+@lru_cache(maxsize=32)
+def _compiled(pattern: str) -> Pattern[str]:
+    """编译并缓存随语言变化的正则表达式。"""
+
+    return re.compile(pattern)
 
 
 def _lang(key: str) -> str:
@@ -32,25 +60,27 @@ def _lang(key: str) -> str:
         str: 对应语言的字符串，若不存在则返回原始 key。
     """
 
+    return _lang_lookup(key, WxParam.LANGUAGE)
+
+
+@lru_cache(maxsize=64)
+def _lang_lookup(key: str, language: str) -> str:
     data = MOMENTS.get(key)
     if not data:
         return key
-    return data.get(WxParam.LANGUAGE, data.get('cn', key))
+    return data.get(language, data.get('cn', key))
+
+
+def _refresh_lang_cache() -> None:
+    """清空文案缓存，在运行时修改 `languages.MOMENTS` 后调用。"""
+
+    _lang_lookup.cache_clear()
 
 
 def _is_time_line(text: str) -> bool:
     """粗略判断一行文本是否为时间信息。"""
 
-    if not text:
-        return False
-    patterns = [
-        r"\d{4}年\d{1,2}月\d{1,2}日",
-        r"\d{2}-\d{2}",
-        r"\d{1,2}:\d{2}",
-        r"昨[天日]",
-        r"星期[一二三四五六日天]",
-    ]
-    return any(re.search(pattern, text) for pattern in patterns)
+    return bool(text) and _TIME_RE.search(text) is not None
 
 
 def _split_like_names(text: str) -> List[str]:
@@ -65,11 +95,16 @@ def _split_like_names(text: str) -> List[str]:
         text = text[len(like_prefix):].lstrip('：: ')
 
     sep = _lang('分隔符_点赞')
-    if sep:
-        parts = [part.strip() for part in text.split(sep) if part.strip()]
-    else:
-        parts = [name.strip() for name in re.split(r'[,:，]', text) if name.strip()]
-    return parts
+    if not sep:
+        seps = _ASCII_LIKE_SEPS if text.isascii() else _LIKE_SEPS
+        found = [candidate for candidate in seps if candidate in text]
+        if len(found) > 1:
+            # 混用多种分隔符时才需要正则
+            return [name for part in _LIKE_SPLIT_RE.split(text) if (name := part.strip())]
+        if not found:
+            return [text] if text else []
+        sep = found[0]
+    return [name for part in text.split(sep) if (name := part.strip())]
 
 
 @dataclass
@@ -88,8 +123,7 @@ class MomentComment:
         author = ''
         content = text
 
-        # 格式示例："张三 回复 李四：你好" 或 "张三: 哈喽"
-        match = re.match(r'^(?P<author>[^：:]+?)\s*(?:回复\s*(?P<reply>[^：:]+?)\s*)?[：:](?P<content>.*)$', text)
+        match = _COMMENT_RE.match(text)
         if match:
             author = match.group('author').strip()
             reply_to = match.group('reply')
@@ -106,11 +140,10 @@ class MomentComment:
 class MomentItem(BaseUISubWnd):
     """朋友圈单条动态。"""
 
-    def __init__(self, control: uia.Control, parent: 'MomentList'):
+    def __init__(self, control: uia.Control, parent: 'MomentList', raw_text: Optional[str] = None):
         self.control = control
         self.parent = parent
         self.root = parent.root
-        self._parsed = False
         self.nickname: str = ''
         self.content: str = ''
         self.location: Optional[str] = None
@@ -119,18 +152,18 @@ class MomentItem(BaseUISubWnd):
         self.comments: List[MomentComment] = []
         self.image_count: int = 0
         self.is_advertisement: bool = False
-        self._comment_controls: Dict[str, uia.Control] = {}
+        # 调用方已读取过控件名称时直接复用，省去一次跨进程调用
+        self._parse(self.control.Name if raw_text is None else raw_text)
 
     # ----------------------------------------------------------------------------------------------
     # 数据解析
     # ----------------------------------------------------------------------------------------------
 
-    def _ensure_parsed(self) -> None:
-        if self._parsed:
-            return
+    def _parse(self, raw_text: Optional[str]) -> None:
+        """解析动态文本，构造时调用一次。"""
 
-        raw_text = self.control.Name or ''
-        lines = [line.strip() for line in raw_text.splitlines() if line.strip()]
+        raw_text = raw_text or ''
+        lines = [stripped for line in raw_text.splitlines() if (stripped := line.strip())]
 
         if lines:
             self.nickname = lines[0]
@@ -140,26 +173,31 @@ class MomentItem(BaseUISubWnd):
         comment_lines: List[str] = []
         likes_line: Optional[str] = None
 
-        for line in body_lines:
+        img_re = _compiled(_lang('re_图片数'))
+        like_prefix = _lang('赞')
+        comment_tag = _lang('评论')
+        ad_tag = _lang('广告')
+
+        for idx, line in enumerate(body_lines):
             if not line:
                 continue
 
-            if re.search(_lang('re_图片数'), line):
-                count = re.findall(r'\d+', line)
+            if img_re.search(line):
+                count = _DIGITS_RE.findall(line)
                 if count:
                     self.image_count = int(count[0])
                 continue
 
-            if line.startswith(_lang('赞')):
+            if line.startswith(like_prefix):
                 likes_line = line
                 continue
 
-            if line == _lang('评论'):
+            if line == comment_tag:
                 # 后续均为评论
-                comment_lines.extend(body_lines[body_lines.index(line) + 1:])
+                comment_lines.extend(body_lines[idx + 1:])
                 break
 
-            if _lang('广告') in line:
+            if ad_tag in line:
                 self.is_advertisement = True
                 continue
 
@@ -169,30 +207,30 @@ class MomentItem(BaseUISubWnd):
 
             content_lines.append(line)
 
-        # 若未在循环中捕获评论，则继续检查剩余行
-        if not comment_lines:
-            collecting = False
-            for line in body_lines:
-                if line == _lang('评论'):
-                    collecting = True
-                    continue
-                if collecting:
-                    comment_lines.append(line)
-
         if likes_line:
             self.likes = _split_like_names(likes_line)
 
         self.content = '\n'.join(content_lines).strip()
         self.comments = [MomentComment.from_text(line) for line in comment_lines if line.strip()]
 
-        # 记录可用于回复的控件
-        for child in self.control.GetChildren():
-            if child.ControlTypeName == 'TextControl':
-                text = (child.Name or '').strip()
-                if text:
-                    self._comment_controls.setdefault(text, child)
+    @cached_property
+    def _comment_lookup(self) -> Tuple[Dict[str, uia.Control], Dict[str, List[Tuple[str, uia.Control]]]]:
+        """记录可用于回复的控件，按完整文本与评论作者分别索引。
+
+        需要额外的跨进程调用，仅在首次定位评论控件时构建。
+        """
 
-        self._parsed = True
+        controls: Dict[str, uia.Control] = {}
+        by_author: Dict[str, List[Tuple[str, uia.Control]]] = {}
+        for control_type, name, child in _snapshot_children(self.control, {'TextControl'}):
+            if control_type == 'TextControl':
+                text = name.strip()
+                if text and text not in controls:
+                    controls[text] = child
+                    if match := _COMMENT_RE.match(text):
+                        author = match.group('author').strip()
+                        by_author.setdefault(author, []).append((text, child))
+        return controls, by_author
 
     # ----------------------------------------------------------------------------------------------
     # 对外属性访问
@@ -200,27 +238,22 @@ class MomentItem(BaseUISubWnd):
 
     @property
     def publisher(self) -> str:
-        self._ensure_parsed()
         return self.nickname
 
     @property
     def text(self) -> str:
-        self._ensure_parsed()
         return self.content
 
     @property
     def timestamp(self) -> str:
-        self._ensure_parsed()
         return self.time
 
     @property
     def like_users(self) -> List[str]:
-        self._ensure_parsed()
         return list(self.likes)
 
     @property
     def comment_list(self) -> List[MomentComment]:
-        self._ensure_parsed()
         return list(self.comments)
 
     # ----------------------------------------------------------------------------------------------
@@ -228,33 +261,94 @@ class MomentItem(BaseUISubWnd):
     # ----------------------------------------------------------------------------------------------
 
     def find_comment(self, author: str) -> Optional[MomentComment]:
-        self._ensure_parsed()
         for comment in self.comments:
             if comment.author == author:
                 return comment
         return None
 
     def get_comment_control(self, comment: MomentComment) -> Optional[uia.Control]:
-        self._ensure_parsed()
+        comment_controls, index_by_author = self._comment_lookup
         key_candidates = [comment.raw, f"{comment.author}: {comment.content}", f"{comment.author}：{comment.content}"]
         for key in key_candidates:
-            if key and key in self._comment_controls:
-                return self._comment_controls[key]
-        # fallback: 遍历匹配
-        for text, ctrl in self._comment_controls.items():
-            if comment.author and text.startswith(comment.author):
-                if comment.content in text:
-                    return ctrl
+            if key and key in comment_controls:
+                return comment_controls[key]
+        if not comment.author:
+            return None
+        # fallback: 在同一作者的评论控件中匹配内容
+        candidates = index_by_author.get(comment.author)
+        if candidates is None:
+            # 无法按作者解析的控件文本，退回逐个前缀匹配
+            candidates = [
+                (text, ctrl) for text, ctrl in comment_controls.items()
+                if text.startswith(comment.author)
+            ]
+        for text, ctrl in candidates:
+            if comment.content in text:
+                return ctrl
         return None
 
 
+# 可能包含朋友圈列表的容器类型，其余叶子控件（按钮、文本、图片等）不再向下遍历
+_CONTAINER_TYPES = frozenset({'PaneControl', 'WindowControl', 'ListControl', 'GroupControl', 'CustomControl'})
+
+
+def _control_info(ctrl: uia.Control) -> Tuple[str, str, str]:
+    """一次性读取控件的类型、ClassName 与 AutomationId。"""
+
+    try:
+        return ctrl.ControlTypeName, ctrl.ClassName or '', ctrl.AutomationId or ''
+    except Exception:
+        return '', '', ''
+
+
+def _snapshot_children(
+        ctrl: uia.Control,
+        name_types: AbstractSet[str]
+    ) -> List[Tuple[str, str, uia.Control]]:
+    """获取子控件快照。
+
+    返回 ``(ControlTypeName, Name, control)`` 列表，供同一次操作中的多处判断复用。
+    仅对 ``name_types`` 中的控件类型读取 Name，其余记为空字符串，避免多余的跨进程调用。
+    """
+
+    try:
+        children = ctrl.GetChildren()
+    except Exception:
+        return []
+    snapshot: List[Tuple[str, str, uia.Control]] = []
+    for child in children:
+        try:
+            control_type = child.ControlTypeName
+            name = (child.Name or '') if control_type in name_types else ''
+        except Exception:
+            continue
+        snapshot.append((control_type, name, child))
+    return snapshot
+
+
+def _snapshot_names(ctrl: uia.Control) -> List[Tuple[str, uia.Control]]:
+    """获取子控件的 ``(Name, control)`` 列表，只读取名称。"""
+
+    try:
+        children = ctrl.GetChildren()
+    except Exception:
+        return []
+    snapshot: List[Tuple[str, uia.Control]] = []
+    for child in children:
+        try:
+            snapshot.append((child.Name or '', child))
+        except Exception:
+            continue
+    return snapshot
+
+
 class MomentList(BaseUISubWnd):
     """朋友圈时间线列表。"""
 
     def __init__(self, parent: 'Moment'):
         self.parent = parent
         self.root = parent.root
-        self.control = self._locate_list(parent)
+        self.control: Optional[uia.Control] = self._locate_list(parent)
         self._items: Optional[List[MomentItem]] = None
 
     def _locate_list(self, parent: 'Moment') -> Optional[uia.Control]:
@@ -266,21 +360,26 @@ class MomentList(BaseUISubWnd):
         except Exception:
             candidates = []
 
-        queue = list(candidates)
-        visited = set()
+        queue = deque(candidates)
+        # 以 id 作为键，避免对 COM 包装对象调用 __eq__/__hash__；
+        # 同时持有控件引用，防止 id 被回收复用
+        visited: Dict[int, uia.Control] = {}
+        comment_tag = _lang('评论')
 
         while queue:
-            ctrl = queue.pop(0)
-            if ctrl in visited:
+            ctrl = queue.popleft()
+            if id(ctrl) in visited:
                 continue
-            visited.add(ctrl)
+            visited[id(ctrl)] = ctrl
 
-            class_name = getattr(ctrl, 'ClassName', '') or ''
-            automation_id = getattr(ctrl, 'AutomationId', '') or ''
-            if ctrl.ControlTypeName == 'ListControl' and ('Moment' in class_name or 'moment' in automation_id.lower()):
+            control_type, class_name, automation_id = _control_info(ctrl)
+            if control_type == 'ListControl' and ('Moment' in class_name or 'moment' in automation_id.lower()):
                 wxlog.debug(f'找到疑似朋友圈列表控件：{class_name}')
                 return ctrl
 
+            if control_type not in _CONTAINER_TYPES:
+                continue
+
             # 朋友圈列表一般会包含“评论”按钮
             children = []
             try:
@@ -288,10 +387,10 @@ class MomentList(BaseUISubWnd):
             except Exception:
                 children = []
 
-            if ctrl.ControlTypeName == 'ListControl':
+            if control_type == 'ListControl':
                 for child in children:
                     try:
-                        if getattr(child, 'Name', '') == _lang('评论'):
+                        if child.Name == comment_tag:
                             wxlog.debug('通过子元素匹配到朋友圈列表控件')
                             return ctrl
                     except Exception:
@@ -327,10 +426,11 @@ class MomentList(BaseUISubWnd):
             for child in children:
                 try:
                     if child.ControlTypeName in {'ListItemControl', 'CustomControl'}:
-                        text = getattr(child, 'Name', '') or ''
-                        if text.strip():
-                            self._items.append(MomentItem(child, self))
-                except Exception:
+                        name = child.Name or ''
+                        if name.strip():
+                            self._items.append(MomentItem(child, self, name))
+                except Exception as e:
+                    wxlog.debug(f'解析朋友圈动态失败：{e}')
                     continue
         return list(self._items)
 
@@ -462,22 +562,35 @@ class MomentActionMenu(BaseUISubWnd):
     def __init__(self, parent: MomentItem, timeout: float = 1.0):
         self.parent = parent
         self.root = parent.root
+        self._children: List[Tuple[str, uia.Control]] = []
         self.control = self._locate(timeout)
 
     def _locate(self, timeout: float) -> Optional[uia.Control]:
+        menu_names = {_lang('赞'), _lang('取消'), _lang('评论')}
+        pid = self.root.pid
+        # 句柄 -> 控件（非本进程窗口记为 None），轮询期间只为新出现的窗口创建 UIA 控件
+        known: Dict[int, Optional[uia.Control]] = {}
+        interval = 0.05
         t0 = time.time()
         while time.time() - t0 <= timeout:
-            wins = find_all_windows_from_root(classname=self._win_cls_name, pid=self.root.pid)
-            for win in wins:
-                try:
-                    children = win.GetChildren()
-                except Exception:
-                    children = []
-                for child in children:
-                    name = getattr(child, 'Name', '')
-                    if name in {_lang('赞'), _lang('取消'), _lang('评论')}:
-                        return win
-            time.sleep(0.05)
+            for hwnd, _, _ in GetAllWindows(classname=self._win_cls_name):
+                if hwnd not in known:
+                    try:
+                        win = uia.ControlFromHandle(hwnd)
+                        known[hwnd] = win if win.ProcessId == pid else None
+                    except Exception:
+                        known[hwnd] = None
+                win = known[hwnd]
+                if win is None:
+                    continue
+                children = _snapshot_names(win)
+                if any(name in menu_names for name, _ in children):
+                    # 菜单按钮随后由 _find_button 直接复用该快照
+                    self._children = children
+                    return win
+            # 菜单通常在前一两次探测内出现，之后逐步放宽轮询间隔
+            time.sleep(interval)
+            interval = min(interval * 2, 0.2)
         return None
 
     def exists(self, wait: float = 0) -> bool:  # type: ignore[override]
@@ -492,16 +605,16 @@ class MomentActionMenu(BaseUISubWnd):
         if not self.control:
             return None
         target_names = list(names)
-        try:
-            children = self.control.GetChildren()
-        except Exception:
-            children = []
-        for child in children:
-            if child.ControlTypeName != 'ButtonControl':
-                continue
-            name = getattr(child, 'Name', '')
+        if not self._children:
+            self._children = _snapshot_names(self.control)
+        for name, child in self._children:
+            # 仅对名称命中的控件再读取类型
             if name in target_names:
-                return child
+                try:
+                    if child.ControlTypeName == 'ButtonControl':
+                        return child
+                except Exception:
+                    continue
         return None
 
     def like(self, cancel: bool = False) -> WxResponse:
@@ -539,33 +652,30 @@ class MomentCommentDialog(BaseUISubWnd):
     def __init__(self, parent: Moment):
         self.parent = parent
         self.root = parent.root
+        self.edit: Optional[uia.Control] = None
+        self.send_button: Optional[uia.Control] = None
+        self._children: List[Tuple[str, str, uia.Control]] = []
         self.control = self._locate()
         if self.control:
             self._init_controls()
 
     def _locate(self) -> Optional[uia.Control]:
+        send_name = _lang('发送')
         wins = find_all_windows_from_root(classname=self._win_cls_name, pid=self.root.pid)
         for win in wins:
-            try:
-                children = win.GetChildren()
-            except Exception:
-                children = []
-            for child in children:
-                if child.ControlTypeName == 'ButtonControl' and getattr(child, 'Name', '') == _lang('发送'):
+            children = _snapshot_children(win, {'ButtonControl'})
+            for control_type, name, _ in children:
+                if control_type == 'ButtonControl' and name == send_name:
+                    self._children = children
                     return win
         return None
 
     def _init_controls(self) -> None:
-        self.edit: Optional[uia.Control] = None
-        self.send_button: Optional[uia.Control] = None
-        try:
-            children = self.control.GetChildren()
-        except Exception:
-            children = []
-        for child in children:
-            if child.ControlTypeName == 'EditControl' and self.edit is None:
+        send_name = _lang('发送')
+        for control_type, name, child in self._children:
+            if control_type == 'EditControl' and self.edit is None:
                 self.edit = child
-            elif child.ControlTypeName == 'ButtonControl' and getattr(child, 'Name', '') == _lang('发送'):
+            elif control_type == 'ButtonControl' and name == send_name:
                 self.send_button = child
 
     def exists(self, wait: float = 0) -> bool:  # type: ignore[override]
@@ -599,8 +709,7 @@ class MomentCommentDialog(BaseUISubWnd):
                 self.edit.SendKeys('{Ctrl}v')
             else:
                 # 退化方案：直接键入
-                for ch in content:
-                    self.edit.SendKeys(ch)
+                self.edit.SendKeys(content.translate(_SENDKEYS_ESCAPE))
 
             if self.send_button and self.send_button.Exists(0):
                 self.send_button.Click()
@@ -13,14 +13,20 @@ from typing import (
     Any,
     TYPE_CHECKING,
     Iterator,
-    Tuple
+    Tuple,
+    FrozenSet,
+    ClassVar
 )
-from hashlib import md5
+from hashlib import blake2b
+from functools import cached_property
 
 if TYPE_CHECKING:
     from wxauto4.ui.chatbox import ChatBox
 
 def truncate_string(s: str, n: int=8) -> str:
+    if len(s) <= n and '\n' not in s:
+        # 短文本无需替换换行，strip 在无空白可去时直接返回原字符串
+        return s.strip()
     s = s.replace('\n', '').strip()
     return s if len(s) <= n else s[:n] + '...'
 
@@ -32,45 +38,92 @@ class Message:
     动态注入。
     """
 
-    _EXCLUDE_FIELDS = {"control", "parent", "root"}
+    _EXCLUDE_FIELDS: ClassVar[FrozenSet[str]] = frozenset({"control", "parent", "root"})
+
+    # 字段名缓存存放在 slot 中，不出现在 vars(msg) 里；__dict__/__weakref__ 保持原有行为
+    __slots__ = ("_public_keys_cache", "__dict__", "__weakref__")
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name not in self.__dict__:
+            # 新增字段时字段集合发生变化，作废缓存
+            object.__setattr__(self, "_public_keys_cache", None)
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name: str) -> None:
+        object.__delattr__(self, name)
+        object.__setattr__(self, "_public_keys_cache", None)
 
     # region --- 迭代/映射相关 -------------------------------------------------
+    def _public_key_cache(self) -> Tuple[Tuple[str, ...], FrozenSet[str]]:
+        """返回可公开的字段名及其集合，字段增删时由 ``__setattr__``/``__delattr__`` 作废"""
+
+        cached = getattr(self, "_public_keys_cache", None)
+        if cached is not None:
+            return cached
+
+        keys = tuple(
+            key for key in self.__dict__
+            if not key.startswith("_") and key not in self._EXCLUDE_FIELDS
+        )
+        cached = (keys, frozenset(keys))
+        object.__setattr__(self, "_public_keys_cache", cached)
+        return cached
+
+    def _ensure_hash(self) -> None:
+        """哈希为惰性计算，开启 MESSAGE_HASH 时在访问字段前补齐"""
+
+        if "hash" not in self.__dict__ and hasattr(type(self), "hash"):
+            self.hash
+            # cached_property 直接写入 __dict__，不经过 __setattr__
+            object.__setattr__(self, "_public_keys_cache", None)
+
+    def _has_public_key(self, key: str) -> bool:
+        if key == "hash":
+            if not WxParam.MESSAGE_HASH:
+                return False
+            self._ensure_hash()
+        return key in self._public_key_cache()[1]
+
+    def _visible_keys(self) -> Tuple[str, ...]:
+        """返回当前可见的字段名，``MESSAGE_HASH`` 仅在此处读取一次"""
+
+        if WxParam.MESSAGE_HASH:
+            self._ensure_hash()
+            return self._public_key_cache()[0]
+        keys, keyset = self._public_key_cache()
+        if "hash" in keyset:
+            return tuple(key for key in keys if key != "hash")
+        return keys
+
     def _iter_public_items(self) -> Iterator[Tuple[str, Any]]:
         """遍历当前消息可公开的字段"""
 
         if not hasattr(self, "__dict__"):
             return
 
-        for key, value in self.__dict__.items():
-            if key.startswith("_") or key in self._EXCLUDE_FIELDS:
-                continue
-            if key == "hash" and not WxParam.MESSAGE_HASH:
-                continue
-            yield key, value
+        data = self.__dict__
+        for key in self._visible_keys():
+            yield key, data[key]
 
     def __iter__(self) -> Iterator[str]:
-        for key, _ in self._iter_public_items():
-            yield key
+        return iter(self._visible_keys())
 
     def __len__(self) -> int:
-        return sum(1 for _ in self._iter_public_items())
+        return len(self._visible_keys())
 
     def __getitem__(self, item: str) -> Any:
-        for key, value in self._iter_public_items():
-            if key == item:
-                return value
+        if isinstance(item, str) and self._has_public_key(item):
+            return self.__dict__[item]
         raise KeyError(item)
 
     def __contains__(self, key: object) -> bool:
-        if not isinstance(key, str):
-            return False
-        return any(field == key for field, _ in self._iter_public_items())
+        return isinstance(key, str) and self._has_public_key(key)
 
     # endregion ----------------------------------------------------------------
 
     # region --- 字段访问 -------------------------------------------------------
     def keys(self) -> Tuple[str, ...]:
-        return tuple(key for key, _ in self._iter_public_items())
+        return self._visible_keys()
 
     def values(self) -> Tuple[Any, ...]:
         return tuple(value for _, value in self._iter_public_items())
@@ -79,9 +132,8 @@ class Message:
         return tuple(self._iter_public_items())
 
     def get(self, key: str, default: Any = None) -> Any:
-        for field, value in self._iter_public_items():
-            if field == key:
-                return value
+        if isinstance(key, str) and self._has_public_key(key):
+            return self.__dict__[key]
         return default
 
     def to_dict(self) -> Dict[str, Any]:
@@ -140,6 +192,9 @@ class Message:
             return hash(msg_id)
 
         if WxParam.MESSAGE_HASH:
+            hash_int = getattr(self, "_hash_int", None)
+            if hash_int is not None:
+                return hash_int
             return hash(getattr(self, "hash", None))
 
         return super().__hash__()
@@ -164,9 +219,19 @@ class BaseMessage(Message, ABC):
         self.root = parent.root
         self.id = self.control.runtimeid
         self.content = self.control.Name
+        # hash_text 为公开字段，始终出现在 keys()/to_dict() 中；仅摘要延迟计算
         rect = self.control.BoundingRectangle
         self.hash_text = f'({rect.height()},{rect.width()}){self.content}'
-        self.hash = md5(self.hash_text.encode()).hexdigest()
+
+    @cached_property
+    def _hash_int(self) -> int:
+        # 固定使用标准库 blake2b，保证不同环境下同一消息的哈希一致
+        digest = blake2b(self.hash_text.encode(), digest_size=8).digest()
+        return int.from_bytes(digest, 'big')
+
+    @cached_property
+    def hash(self) -> str:
+        return f'{self._hash_int:016x}'
 
     def __repr__(self):
         cls_name = self.__class__.__name__
@@ -20,9 +20,13 @@ from wxauto4.msgs.msg import parse_msg
 import time
 import os
 import re
+from hashlib import md5
 from typing import Iterable, Optional, Sequence, Tuple, Union
 
 def truncate_string(s: str, n: int=8) -> str:
+    if len(s) <= n and '\n' not in s:
+        # 短文本无需替换换行，strip 在无空白可去时直接返回原字符串
+        return s.strip()
     s = s.replace('\n', '').strip()
     return s if len(s) <= n else s[:n] + '...'
 
@@ -339,11 +343,19 @@ class ChatBox(BaseUISubWnd):
         if not msg_hash:
             return None
         msg_hash = msg_hash.strip()
-        is_digest = bool(re.fullmatch(r"[0-9a-fA-F]{32}", msg_hash))
+        is_digest = bool(re.fullmatch(r"[0-9a-fA-F]{16}", msg_hash))
+        # 兼容旧版本生成的 32 位 md5 哈希
+        is_legacy = bool(re.fullmatch(r"[0-9a-fA-F]{32}", msg_hash))
         controls = list(self._iter_message_controls())
         for msg_control in reversed(controls):
             msg = parse_msg(msg_control, self)
-            candidate = msg.hash if is_digest else getattr(msg, 'hash_text', None)
+            hash_text = getattr(msg, 'hash_text', None)
+            if is_digest:
+                candidate = msg.hash
+            elif is_legacy and hash_text is not None:
+                candidate = md5(hash_text.encode()).hexdigest()
+            else:
+                candidate = hash_text
             if candidate == msg_hash:
                 return msg
         return None
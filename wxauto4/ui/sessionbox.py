@@ -10,10 +10,76 @@ from wxauto4.utils.win32 import SetClipboardText
 from wxauto4.logger import wxlog
 import time
 from typing import (
+    Callable,
+    Dict,
+    Tuple,
     Union,
     List
 )
 import re
+from functools import cached_property
+
+
+UNREAD_PATTERN = re.compile(r'\[(\d+)条\]')
+# (菜单项键名, 语言) -> 菜单显示文本，语言作为键的一部分，切换语言后不会命中旧值
+_OPTION_CACHE: Dict[Tuple[str, str], str] = {}
+# 搜索结果中通过微信号/昵称命中时的文本分隔标记
+SEARCH_RESULT_MARKERS = (' 微信号: ', ' 昵称: ')
+
+
+def _split_texts(content: str) -> List[str]:
+    """拆分控件文本为非空行"""
+
+    return [
+        line for line in content.split('\n')
+        if line and line.strip()
+    ]
+
+
+def _resolve(option_key: str, lang: str) -> str:
+    """解析菜单项在指定语言下的文本并写入缓存"""
+
+    option = MENU_OPTIONS.get(option_key, {})
+    text = option.get(lang) if isinstance(option, dict) else None
+    if not text:
+        text = option.get('cn') if isinstance(option, dict) else None
+    text = text or option_key
+    _OPTION_CACHE[(option_key, lang)] = text
+    return text
+
+
+def _menu_option_text(option_key: str) -> str:
+    """获取菜单项在当前配置语言下的文本"""
+
+    lang = getattr(WxParam, 'LANGUAGE', 'cn')
+    return _OPTION_CACHE.get((option_key, lang)) or _resolve(option_key, lang)
+
+
+def _wait_until(
+        predicate: Callable[[], bool],
+        timeout: Union[float, int],
+        interval: float = 0.02
+    ) -> bool:
+    """轮询等待条件成立，最长等待 timeout 秒
+
+    Args:
+        predicate (Callable[[], bool]): 判断条件，抛出异常视为不成立
+        timeout (Union[float, int]): 最长等待时间，单位秒
+        interval (float): 轮询间隔，单位秒
+
+    Returns:
+        bool: 条件是否在超时前成立
+    """
+    deadline = time.perf_counter() + timeout
+    while True:
+        try:
+            if predicate():
+                return True
+        except Exception:
+            pass
+        if time.perf_counter() >= deadline:
+            return False
+        time.sleep(interval)
 
 
 class SessionBox:
@@ -29,6 +95,7 @@ class SessionBox:
             ListControl(ClassName="mmui::XTableView", Name="会话")
         self.search_content = self.parent.control.WindowControl(ClassName="mmui::SearchContentPopover")
         
+
     def roll_up(self, n: int=5):
         self.control.MiddleClick()
         self.control.WheelUp(wheelTimes=n)
@@ -48,7 +115,26 @@ class SessionBox:
             keywords: str,
             force: bool = False,
             force_wait: Union[float, int] = 0.5
-        ):
+        ) -> List[SearchResultElement]:
+        search_result = self._trigger_search(keywords, force, force_wait)
+        return [SearchResultElement(i) for i in search_result.GetChildren()]
+
+    def _trigger_search(
+            self,
+            keywords: str,
+            force: bool = False,
+            force_wait: Union[float, int] = 0.5
+        ) -> uia.ListControl:
+        """在搜索框中输入关键词并返回搜索结果列表控件
+
+        Args:
+            keywords (str): 搜索关键词
+            force (bool): 是否等待搜索结果出现
+            force_wait (Union[float, int]): 等待搜索结果的最长时间，单位秒
+
+        Returns:
+            uia.ListControl: 搜索结果列表控件
+        """
         self.searchbox.RightClick()
         SetClipboardText(keywords)
         menu = Menu(self)
@@ -58,11 +144,12 @@ class SessionBox:
         search_result = self.search_content.ListControl()
 
         if force:
-            time.sleep(force_wait)
+            # force_wait 为最长等待时间，搜索结果出现后立即返回
+            _wait_until(lambda: bool(search_result.GetChildren()), force_wait)
             # self.searchbox.SendKeys('{ENTER}')
             # return ''
 
-        return [SearchResultElement(i) for i in search_result.GetChildren()]
+        return search_result
     
     def switch_chat(
         self,
@@ -72,35 +159,41 @@ class SessionBox:
         force_wait: Union[float, int] = 0.5
     ):
         wxlog.debug(f"切换聊天窗口: {keywords}, {exact}, {force}, {force_wait}")
-        search_box = self.search_content.ListControl()
-        search_result = self.search(keywords, force, force_wait)
-        t0 = time.time()
-        while time.time() -t0 < WxParam.SEARCH_CHAT_TIMEOUT:
-            results = []
+        search_box = self._trigger_search(keywords, force, force_wait)
+        kw_lower = keywords.lower()
+        interval = 0.02
+        prev_signature = None
+        deadline = time.perf_counter() + WxParam.SEARCH_CHAT_TIMEOUT
+        while time.perf_counter() < deadline:
             search_result_items = search_box.GetChildren()
+            signature = (
+                len(search_result_items),
+                search_result_items[-1].Name if search_result_items else None
+            )
+            if signature == prev_signature:
+                # 搜索结果未变化，跳过逐项比对并逐步放宽轮询间隔
+                time.sleep(interval)
+                interval = min(interval * 2, 0.2)
+                continue
+            prev_signature = signature
+            interval = 0.02
             for search_result_item in search_result_items:
                 text: str = search_result_item.Name
                 if exact:
                     if text == keywords:
                         search_result_item.Click()
                         return keywords
-                    elif (
-                        ' 微信号: ' in text
-                        and (split:=text.split(' 微信号: '))[-1].lower() == keywords.lower()
-                    ):
-                        search_result_item.Click()
-                        return split[0]
-                    elif (
-                        ' 昵称: ' in text
-                        and (split:=text.split(' 昵称: '))[-1].lower() == keywords.lower()
-                    ):
-                        search_result_item.Click()
-                        return split[0]
+                    for marker in SEARCH_RESULT_MARKERS:
+                        head, sep, tail = text.partition(marker)
+                        if sep and tail.lower() == kw_lower:
+                            search_result_item.Click()
+                            return head
                 else:
                     if keywords in text:
                         search_result_item.Click()
                         return text
-                    
+            time.sleep(interval)
+
         if self.search_content.Exists(0):
             self.control.MiddleClick()
 
@@ -109,14 +202,66 @@ class SessionBox:
         realname = self.switch_chat(name)
         if not realname:
             return WxResponse.failure('未找到会话')
-        time.sleep(0.3)
-        while True:
-            session = [i for i in self.get_session() if uia.IsElementInWindow(self.session_list, i.control)][0]
-            if session.content.startswith(realname):
-                break
-        session.double_click()
+        control = self._find_session_by_prefix(realname, WxParam.SEARCH_CHAT_TIMEOUT)
+        if control is None:
+            return WxResponse.failure('未找到会话')
+        SessionElement(control, self).double_click()
         return WxResponse.success(data={'nickname': realname})
 
+    def _find_session_by_prefix(self, prefix: str, timeout: Union[float, int]):
+        """在会话列表可见区域中查找名称以 prefix 开头的会话控件
+
+        Args:
+            prefix (str): 会话名称前缀
+            timeout (Union[float, int]): 最长等待时间，单位秒
+
+        Returns:
+            uia.Control: 匹配到的原始会话控件，超时返回None
+        """
+        interval = 0.02
+        deadline = time.perf_counter() + timeout
+        while True:
+            if self.session_list.Exists(0):
+                for control in self.session_list.GetChildren():
+                    # 先比较名称，仅对命中的控件做可见性判断
+                    if (
+                        control.Name.startswith(prefix)
+                        and uia.IsElementInWindow(self.session_list, control)
+                    ):
+                        return control
+            if time.perf_counter() >= deadline:
+                return None
+            time.sleep(interval)
+            interval = min(interval * 2, 0.2)
+
+
+    def batch_session_action(
+            self,
+            sessions: List[SessionElement],
+            option_key: str,
+            wait: Union[float, int] = 0.3
+        ) -> List[WxResponse]:
+        """对多个会话依次执行同一右键菜单操作
+
+        菜单文本只解析一次；每次右键后都会重新定位新弹出的菜单窗口。
+
+        Args:
+            sessions (List[SessionElement]): 要操作的会话
+            option_key (str): 菜单项键名，参考 languages.MENU_OPTIONS
+            wait (Union[float, int]): 每次等待菜单弹出的最长时间，单位秒
+
+        Returns:
+            List[WxResponse]: 与 sessions 一一对应的操作结果
+        """
+        option_text = _menu_option_text(option_key)
+        results = []
+        for session in sessions:
+            session._click(right=True)
+            menu = Menu(self)
+            # wait 为最长等待时间，菜单选项出现后立即选择
+            _wait_until(lambda: menu.exists(0) and bool(menu.option_controls), wait)
+            results.append(menu.select(option_text))
+        return results
 
     def go_top(self):
         wxlog.debug("回到会话列表顶部")
@@ -137,61 +282,53 @@ class SessionElement:
         self.root = parent.root
         self.parent = parent
         self.control = control
-        self.content = control.Name
+        self.content = str(control.Name)
+        self._texts = _split_texts(self.content)
 
     @property
     def texts(self) -> List[str]:
         """拆分当前会话控件中的文本行"""
 
-        return [
-            line for line in str(self.content).split('\n')
-            if line and line.strip()
-        ]
+        return list(self._texts)
 
     @property
     def name(self) -> str:
         """会话名称"""
 
-        if self.texts:
-            return self.texts[0]
-        return ''
+        return self._texts[0] if self._texts else ''
 
     @property
     def unread_count(self) -> int:
         """未读消息数量"""
 
-        unread_pattern = re.compile(r'\[(\d+)条\]')
-        for text in self.texts:
-            if match := unread_pattern.search(text):
+        for text in self._texts:
+            if match := UNREAD_PATTERN.search(text):
                 return int(match.group(1))
         return 0
 
     def _menu_option_text(self, option_key: str) -> str:
-        option = MENU_OPTIONS.get(option_key, {})
-        lang = getattr(WxParam, 'LANGUAGE', 'cn')
-        text = option.get(lang) if isinstance(option, dict) else None
-        if not text:
-            text = option.get('cn') if isinstance(option, dict) else None
-        return text or option_key
+        return _menu_option_text(option_key)
 
     def select_menu_option(self, option_key: str, wait=0.3):
         """根据配置语言选择菜单项"""
 
-        option_text = self._menu_option_text(option_key)
-        return self.select_option(option_text, wait)
+        return self.parent.batch_session_action([self], option_key, wait)[0]
 
     def __repr__(self):
-        content = str(self.content).replace('\n', ' ')
-        if len(content) > 5:
-            content = content[:5] + '...'
-        return f"<wxauto4 Session Element({content})>"
+        preview = self.content[:6].replace('\n', ' ')
+        if len(preview) > 5:
+            preview = preview[:5] + '...'
+        return f"<wxauto4 Session Element({preview})>"
     
     def roll_into_view(self):
         uia.RollIntoView(self.control.GetParentControl(), self.control)
 
     # @uilock
     def _click(self, right: bool=False, double: bool=False):
-        self.roll_into_view()
+        parent = self.control.GetParentControl()
+        # 已在可见区域内时无需滚动
+        if not uia.IsElementInWindow(parent, self.control):
+            uia.RollIntoView(parent, self.control)
         if right:
             self.control.RightClick()
         elif double:
@@ -206,14 +343,15 @@ class SessionElement:
         self._click(right=True)
 
     def double_click(self):
-        self._click()
-        self._click(double=True)
+        self.roll_into_view()
+        self.control.DoubleClick()
 
     def select_option(self, option: str, wait=0.3):
         self.roll_into_view()
         self.control.RightClick()
-        time.sleep(wait)
         menu = Menu(self.parent)
+        # wait 为最长等待时间，菜单选项出现后立即选择
+        _wait_until(lambda: menu.exists(0) and bool(menu.option_controls), wait)
         return menu.select(option)
 
     def pin(self):
@@ -254,20 +392,27 @@ class SessionElement:
 class SearchResultElement:
     def __init__(self, control):
         self.control = control
-        self.content = control.Name
-        self.type = control.ClassName
+
+    @cached_property
+    def content(self) -> str:
+        return str(self.control.Name)
+
+    @cached_property
+    def type(self) -> str:
+        return self.control.ClassName
 
     def __repr__(self):
-        content = str(self.content).replace('\n', ' ')
-        if len(content) > 5:
-            content = content[:5] + '...'
-        return f"<wxauto4 Search Element({content})>"
+        preview = self.content[:6].replace('\n', ' ')
+        if len(preview) > 5:
+            preview = preview[:5] + '...'
+        return f"<wxauto4 Search Element({preview})>"
+
+    @cached_property
+    def _texts(self) -> List[str]:
+        return _split_texts(self.content)
 
     def get_all_text(self):
-        return [
-            line for line in str(self.content).split('\n')
-            if line and line.strip()
-        ]
+        return list(self._texts)
     
     def click(self):
         uia.RollIntoView(self.control.GetParentControl(), self.control)
@@ -9,6 +9,7 @@ import multiprocessing
 import threading
 from contextlib import asynccontextmanager, contextmanager
 from typing import Any, Awaitable, Callable, TypeVar, overload
+from weakref import WeakKeyDictionary
 
 
 F = TypeVar("F", bound=Callable[..., Any])
@@ -20,22 +21,20 @@ class LockManager:
 
     process_lock = multiprocessing.Lock()
     thread_lock = threading.RLock()
-    _async_lock: asyncio.Lock | None = None
+    _async_locks: "WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = WeakKeyDictionary()
 
     @classmethod
     def _get_async_lock(cls) -> asyncio.Lock:
-        """返回与当前事件循环绑定的 ``asyncio.Lock``。"""
+        """返回与当前事件循环绑定的 ``asyncio.Lock``。
 
-        loop = None
-        try:
-            loop = asyncio.get_running_loop()
-        except RuntimeError:
-            pass
+        每个事件循环各自持有一把锁，事件循环被回收后对应的锁随之释放。
+        """
 
-        lock = cls._async_lock
-        if lock is None or (loop and getattr(lock, "_loop", loop) is not loop):
+        loop = asyncio.get_running_loop()
+        lock = cls._async_locks.get(loop)
+        if lock is None:
             lock = asyncio.Lock()
-            cls._async_lock = lock
+            cls._async_locks[loop] = lock
         return lock
 
     @classmethod
@@ -47,15 +46,54 @@ class LockManager:
             with cls.thread_lock:
                 yield
 
+    @classmethod
+    async def _acquire_process_lock(cls) -> None:
+        """在线程池中等待进程锁，避免阻塞事件循环。"""
+
+        if cls.process_lock.acquire(block=False):
+            return
+
+        guard = threading.Lock()
+        state = {"acquired": False, "abandoned": False}
+
+        def _blocking_acquire() -> None:
+            cls.process_lock.acquire()
+            with guard:
+                if state["abandoned"]:
+                    cls.process_lock.release()
+                else:
+                    state["acquired"] = True
+
+        try:
+            await asyncio.to_thread(_blocking_acquire)
+        except BaseException:
+            # 等待被取消时线程仍可能随后拿到锁，由后完成的一方负责释放
+            with guard:
+                state["abandoned"] = True
+                if state["acquired"]:
+                    cls.process_lock.release()
+            raise
+
     @classmethod
     @asynccontextmanager
     async def acquire_async(cls):
-        """异步环境下获取锁。"""
+        """异步环境下获取锁。
+
+        进程锁在线程池中等待；线程锁为 ``RLock``，必须由事件循环线程持有，
+        因此以非阻塞方式轮询获取，等待期间让出事件循环。
+        """
 
         async with cls._get_async_lock():
-            with cls.process_lock:
-                with cls.thread_lock:
+            await cls._acquire_process_lock()
+            try:
+                while not cls.thread_lock.acquire(blocking=False):
+                    await asyncio.sleep(0.005)
+                try:
                     yield
+                finally:
+                    cls.thread_lock.release()
+            finally:
+                cls.process_lock.release()
 
 
 @overload
@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import platform
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 可选依赖
+    orjson = None
 
 ENCODING = "utf-8"
 LICENSE_DIR = Path.home() / ".wxauto4"
@@ -20,9 +27,10 @@ def _ensure_dir() -> None:
     LICENSE_DIR.mkdir(parents=True, exist_ok=True)
 
 
-def _machine_fingerprint() -> Dict[str, Any]:
+@functools.lru_cache(maxsize=1)
+def _machine_fingerprint_cached() -> Mapping[str, Any]:
     uname = platform.uname()
-    return {
+    return MappingProxyType({
         "system": uname.system,
         "node": uname.node,
         "release": uname.release,
@@ -30,7 +38,12 @@ def _machine_fingerprint() -> Dict[str, Any]:
         "machine": uname.machine,
         "processor": uname.processor,
         "mac": f"{uuid.getnode():012x}",
-    }
+    })
+
+
+def _machine_fingerprint() -> Dict[str, Any]:
+    # 机器信息在进程生命周期内不变，只采集一次；返回副本供调用方修改
+    return dict(_machine_fingerprint_cached())
 
 
 def _write_json(path: Path, data: Dict[str, Any]) -> None:
@@ -39,7 +52,18 @@ def _write_json(path: Path, data: Dict[str, Any]) -> None:
         **data,
         "generated_at": datetime.utcnow().isoformat(timespec="seconds"),
     }
-    path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding=ENCODING)
+    if orjson is not None:
+        # orjson 直接输出 UTF-8 字节，省去 str 构建与再编码
+        path.write_bytes(orjson.dumps(
+            payload,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        ))
+    else:
+        path.write_text(
+            json.dumps(payload, ensure_ascii=False, indent=2, default=str),
+            encoding=ENCODING,
+        )
     print(f"已生成文件: {path}")
 
 
@@ -75,11 +99,12 @@ def authenticate_with_file(path: str) -> None:
     if not code:
         raise ValueError("授权文件中没有找到授权码")
 
+    # 文件中的其余字段原样保留，授权码与机器信息以本次为准
     payload: Dict[str, Any] = {
+        **(data if isinstance(data, dict) else {}),
         "license_code": str(code).strip(),
         "machine": _machine_fingerprint(),
     }
-    payload.update({k: v for k, v in data.items() if k not in payload})
     _write_json(LICENSE_FILE, payload)
     print("已从授权文件导入授权信息。")
 